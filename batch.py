@@ -0,0 +1,128 @@
+""" Headless batch checking: stream sentences through nlp.pipe and write JSONL results. """
+import argparse
+import json
+import sys
+import time
+
+from checker import check_doc, get_nlp
+import metrics
+from rewrite import add_rewrite_arguments, rewrites_from_args
+from store import AnalysisStore
+
+STORE_CHUNK_BATCHES = 16
+
+
+def read_sentences(stream):
+    """ Yield one stripped sentence per non-empty input line. """
+    for line in stream:
+        sentence = line.strip()
+        if sentence:
+            yield sentence
+
+def result_for_doc(doc):
+    """ The JSON-serializable result for one parsed sentence. """
+    subject, verb, obj, feedback, findings = check_doc(doc)
+    return {
+        "sentence": doc.text,
+        "subject": subject,
+        "verb": verb,
+        "object": obj,
+        "feedback": feedback,
+        "findings": [finding.rule for finding in findings],
+    }
+
+def check_sentences(sentences, batch_size=256, n_process=1, store=None):
+    """ Check an iterable of sentences lazily, yielding one result dict per sentence.
+
+    With an AnalysisStore, only sentences missing from the store are parsed.
+    """
+    if store is not None:
+        yield from _check_incremental(sentences, batch_size, n_process, store)
+        return
+    docs = get_nlp().pipe(sentences, batch_size=batch_size, n_process=n_process)
+    for doc in docs:
+        yield result_for_doc(doc)
+
+def _check_incremental(sentences, batch_size, n_process, store):
+    # Large chunks keep the nlp.pipe worker pool busy between store lookups
+    chunk_size = max(batch_size, 1) * STORE_CHUNK_BATCHES
+    for chunk in _chunked(sentences, chunk_size):
+        results = store.get_many(set(chunk))
+        missing = list(dict.fromkeys(sentence for sentence in chunk if sentence not in results))
+        if missing:
+            start = time.perf_counter()
+            entries = []
+            for doc in get_nlp().pipe(missing, batch_size=batch_size, n_process=n_process):
+                result = result_for_doc(doc)
+                results[doc.text] = result
+                entries.append((doc, result))
+            store.put_many(entries, parse_seconds=time.perf_counter() - start)
+        for sentence in chunk:
+            yield results[sentence]
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def write_jsonl(results, out):
+    """ Write results as JSON lines as they are produced, returning the count written. """
+    count = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        count += 1
+        if count % 1000 == 0:
+            out.flush()
+    out.flush()
+    return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check sentences (one per line) and write JSONL results.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file, or - for stdout (default)")
+    parser.add_argument("--batch-size", type=int, default=256, help="sentences per nlp.pipe batch")
+    parser.add_argument("--n-process", type=int, default=1, help="worker processes for nlp.pipe")
+    parser.add_argument("--metrics", action="store_true", help="print stage timings and counters as JSON to stderr")
+    parser.add_argument("--store", metavar="PATH", help="SQLite analysis store; only new or changed sentences are parsed")
+    add_rewrite_arguments(parser)
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    store = AnalysisStore(get_nlp(), args.store) if args.store else None
+    report = None
+    try:
+        results = check_sentences(read_sentences(src), batch_size=args.batch_size, n_process=args.n_process, store=store)
+        results = rewrites_from_args(results, args)
+        count = write_jsonl(results, out)
+        if store is not None:
+            # The report reads the store's metadata, so build it while the connection is open
+            report = store.report()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+        if store is not None:
+            store.close()
+    print(f"Checked {count} sentences.", file=sys.stderr)
+    if args.metrics:
+        print(json.dumps(metrics.snapshot(), indent=2), file=sys.stderr)
+    if report is not None:
+        if report["invalidated"]:
+            print(f"Model, rules or feedback changed: dropped {report['invalidated']} stored analyses.", file=sys.stderr)
+        print(
+            f"Store: {report['hits']} reused, {report['misses']} parsed in {report['parse_seconds']:.1f}s; "
+            f"saved about {report['saved_seconds']:.1f}s of parsing.",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+""" Compare batch throughput (nlp.pipe) against parsing and checking one sentence at a time.
+
+Run from the repository root:  python -m benchmarks.bench_batch --sentences 5000
+"""
+import argparse
+import time
+
+from batch import check_sentences
+from benchmarks.samples import SAMPLE_SENTENCES, make_corpus
+from checker import check_doc, get_nlp
+
+
+def bench_loop(sentences):
+    # Call nlp() directly: process_sentence() would be served from the analysis LRU cache
+    nlp = get_nlp()
+    start = time.perf_counter()
+    for sentence in sentences:
+        check_doc(nlp(sentence))
+    return time.perf_counter() - start
+
+def bench_batch(sentences, batch_size, n_process):
+    start = time.perf_counter()
+    for _ in check_sentences(sentences, batch_size=batch_size, n_process=n_process):
+        pass
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--n-process", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args()
+
+    sentences = make_corpus(args.sentences)
+    # Warm up the pipeline so the first measurement doesn't pay for lazy init.
+    check_doc(get_nlp()(SAMPLE_SENTENCES[0]))
+
+    elapsed = bench_loop(sentences)
+    print(f"{'one-by-one loop':<28}{len(sentences) / elapsed:>10.1f} sentences/sec")
+    for n_process in args.n_process:
+        elapsed = bench_batch(sentences, args.batch_size, n_process)
+        label = f"nlp.pipe n_process={n_process}"
+        print(f"{label:<28}{len(sentences) / elapsed:>10.1f} sentences/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+""" Throughput and peak memory of document mode on a large generated article.
+
+Run from the repository root:  python -m benchmarks.bench_document --chars 60000
+"""
+import argparse
+import itertools
+import resource
+import time
+
+from benchmarks.samples import SAMPLE_SENTENCES
+from document import DEFAULT_MAX_CHARS, check_document
+
+
+def make_article(target_chars, sentences_per_paragraph=6):
+    """ Build an article of roughly target_chars from the sample sentences, in paragraphs. """
+    sentences = itertools.cycle(SAMPLE_SENTENCES)
+    paragraphs = []
+    size = 0
+    while size < target_chars:
+        paragraph = " ".join(next(sentences) for _ in range(sentences_per_paragraph))
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=60000)
+    parser.add_argument("--max-chars", type=int, nargs="+", default=[2000, DEFAULT_MAX_CHARS, 50000])
+    args = parser.parse_args()
+
+    article = make_article(args.chars)
+    print(f"Article: {len(article)} characters")
+    print(f"{'max_chars':>10}{'seconds':>10}{'sentences/s':>14}{'chars/s':>12}{'findings':>10}")
+    for max_chars in args.max_chars:
+        start = time.perf_counter()
+        sentences = findings = 0
+        for result in check_document(article, max_chars=max_chars):
+            sentences += 1
+            findings += len(result["findings"])
+        elapsed = time.perf_counter() - start
+        print(f"{max_chars:>10}{elapsed:>10.2f}{sentences / elapsed:>14.1f}{len(article) / elapsed:>12.0f}{findings:>10}")
+    # ru_maxrss is in kilobytes on Linux
+    print(f"Peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+""" pytest-benchmark suite for the checking pipeline on short, long and paragraph inputs.
+
+Not collected by a plain `pytest` run. Run it explicitly from the repository root:
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-only
+and compare against a saved baseline with --benchmark-autosave / --benchmark-compare.
+"""
+import pytest
+from spacy import displacy
+
+from benchmarks.samples import SAMPLE_SENTENCES
+from checker import TREE_OPTIONS, Analysis, check_doc, get_nlp, parse
+from document import check_document
+
+INPUTS = {
+    "short": "John threw the ball.",
+    "long": (
+        "After the long meeting that had been scheduled weeks in advance, the committee, which was "
+        "not entirely convinced by the proposal, quickly decided that the budget would be reviewed "
+        "again by an external auditor before any final decision was made."
+    ),
+    "paragraph": " ".join(SAMPLE_SENTENCES * 3),
+}
+
+
+@pytest.fixture(scope="module")
+def nlp():
+    return get_nlp()
+
+@pytest.mark.parametrize("size", INPUTS)
+def test_parse(benchmark, nlp, size):
+    benchmark(parse, INPUTS[size])
+
+@pytest.mark.parametrize("size", INPUTS)
+def test_rules_and_feedback(benchmark, nlp, size):
+    doc = nlp(INPUTS[size])
+    benchmark(check_doc, doc)
+
+@pytest.mark.parametrize("size", INPUTS)
+def test_process_sentence_uncached(benchmark, nlp, size):
+    # Bypass the LRU cache so every round pays for the parse
+    benchmark(lambda: Analysis(parse(INPUTS[size])).feedback)
+
+@pytest.mark.parametrize("size", INPUTS)
+def test_render_syntax_tree(benchmark, nlp, size):
+    # displaCy alone, so rule or feedback changes don't show up as render regressions
+    doc = nlp(INPUTS[size])
+    benchmark(displacy.render, doc, style="dep", options=TREE_OPTIONS, jupyter=False)
+
+def test_document_mode_paragraph(benchmark, nlp):
+    benchmark(lambda: list(check_document(INPUTS["paragraph"])))
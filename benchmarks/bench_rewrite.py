@@ -0,0 +1,44 @@
+""" CPU benchmark of batched versus per-sentence T5 rewrite generation (cache disabled).
+
+Run from the repository root:  python -m benchmarks.bench_rewrite --sentences 32 --batch-size 8
+"""
+import argparse
+import time
+
+from benchmarks.samples import SAMPLE_SENTENCES
+from checker import get_generator
+from rewrite import RewriteSettings, suggest_rewrites
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-new-tokens", type=int, default=64)
+    parser.add_argument("--num-beams", type=int, default=4)
+    args = parser.parse_args()
+
+    # Distinct sentences so de-duplication doesn't hide generation cost
+    requests = [
+        (f"{SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)].rstrip('.')} on day {i}.", "passive_voice")
+        for i in range(args.sentences)
+    ]
+    get_generator()  # load the model outside the timed region
+
+    single = RewriteSettings(args.max_new_tokens, args.num_beams, batch_size=1)
+    start = time.perf_counter()
+    for request in requests:
+        suggest_rewrites([request], single)
+    per_sentence = time.perf_counter() - start
+
+    batched = RewriteSettings(args.max_new_tokens, args.num_beams, batch_size=args.batch_size)
+    start = time.perf_counter()
+    suggest_rewrites(requests, batched)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"{'per-sentence':<24}{len(requests) / per_sentence:>10.2f} sentences/sec")
+    print(f"{f'batched (size {args.batch_size})':<24}{len(requests) / batch_elapsed:>10.2f} sentences/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+""" Micro-benchmark the single-pass RuleEngine against the legacy if/elif feedback chain.
+
+Docs are parsed once up front so only rule evaluation is timed. Run from the repository root:
+    python -m benchmarks.bench_rules --sentences 5000
+"""
+import argparse
+import time
+
+from benchmarks.samples import make_corpus
+from checker import check_order, extract_svo, get_nlp, get_rule_engine, provide_feedback
+
+
+def legacy_feedback(doc):
+    """ The original process_sentence chain: substring tests plus separate token walks. """
+    sentence = doc.text
+    subject, verb, obj = extract_svo(doc)
+    order_feedback = check_order(doc, subject, verb, obj)
+    if not subject:
+        return provide_feedback("subject")
+    elif not verb:
+        return provide_feedback("verb")
+    elif not obj:
+        return provide_feedback("object")
+    elif "not" in sentence:
+        return provide_feedback("negative_sentence")
+    elif len(subject.split()) > 1:
+        return provide_feedback("multiple_subjects")
+    elif "quickly" in sentence:
+        return provide_feedback("adverb_placement")
+    elif len(sentence.split()) > 10:
+        return provide_feedback("complex_sentence")
+    elif len(set([subject, verb, obj])) == 3:
+        return order_feedback
+    elif len(subject.split()) > 2:
+        return provide_feedback("compound_sentence")
+    elif "enjoys" in sentence:
+        return provide_feedback("incorrect_noun_usage")
+    elif "doesn't need no" in sentence:
+        return provide_feedback("double_negative")
+    elif "almost" in sentence:
+        return provide_feedback("misplaced_modifier")
+    elif "," in sentence:
+        return provide_feedback("comma_splice")
+    return order_feedback
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=2000)
+    args = parser.parse_args()
+
+    docs = list(get_nlp().pipe(make_corpus(args.sentences)))
+    engine = get_rule_engine()
+
+    start = time.perf_counter()
+    for doc in docs:
+        legacy_feedback(doc)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for doc in docs:
+        engine.run(doc)
+    single_pass = time.perf_counter() - start
+
+    print(f"{'legacy chain':<24}{legacy / len(docs) * 1e6:>10.1f} us/sentence")
+    print(f"{'rule engine':<24}{single_pass / len(docs) * 1e6:>10.1f} us/sentence")
+
+    timings = {}
+    for doc in docs:
+        engine.run(doc, timings=timings)
+    print("\nPer-rule cost (timed run):")
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<22}{seconds / len(docs) * 1e6:>10.2f} us/sentence")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+""" Measure cold-start cost: importing the checker, loading the spaCy model, and the first request.
+
+Each run happens in a fresh interpreter so nothing is warm. Run from the repository root:
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import checker
+t1 = time.perf_counter()
+checker.get_nlp()
+t2 = time.perf_counter()
+checker.process_sentence("John threw the ball.")
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "model_load": t2 - t1, "first_request": t3 - t2}))
+"""
+
+STAGES = ("import", "model_load", "first_request")
+
+
+def run_once():
+    out = subprocess.run([sys.executable, "-c", PROBE], check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    print(f"{'stage':<16}{'median ms':>12}{'max ms':>12}")
+    for stage in STAGES:
+        values = [run[stage] * 1000 for run in runs]
+        print(f"{stage:<16}{statistics.median(values):>12.1f}{max(values):>12.1f}")
+    total = [sum(run[stage] for stage in STAGES) * 1000 for run in runs]
+    print(f"{'total':<16}{statistics.median(total):>12.1f}{max(total):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
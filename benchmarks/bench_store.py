@@ -0,0 +1,54 @@
+""" Time a cold run, a warm run and a 5%-changed run against a fresh AnalysisStore.
+
+Run from the repository root:  python -m benchmarks.bench_store --sentences 5000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from batch import check_sentences
+from checker import get_nlp
+from store import AnalysisStore
+
+
+def make_corpus(n, revision=0, changed=0.0):
+    """ n distinct sentences; a fraction `changed` of them differ between revisions. """
+    sentences = []
+    for i in range(n):
+        edited = revision and i < n * changed
+        sentences.append(f"Writer {i} {'rewrote' if edited else 'wrote'} the draft in revision {revision if edited else 0}.")
+    return sentences
+
+def timed_run(sentences, path):
+    store = AnalysisStore(get_nlp(), path)
+    start = time.perf_counter()
+    for _ in check_sentences(sentences, store=store):
+        pass
+    elapsed = time.perf_counter() - start
+    report = store.report()
+    store.close()
+    return elapsed, report
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=5000)
+    parser.add_argument("--changed", type=float, default=0.05)
+    args = parser.parse_args()
+
+    get_nlp()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "analyses.sqlite3")
+        runs = [
+            ("cold", make_corpus(args.sentences)),
+            ("warm (unchanged)", make_corpus(args.sentences)),
+            (f"{args.changed:.0%} changed", make_corpus(args.sentences, revision=1, changed=args.changed)),
+        ]
+        print(f"{'run':<20}{'seconds':>10}{'reused':>10}{'parsed':>10}{'saved s':>10}")
+        for label, sentences in runs:
+            elapsed, report = timed_run(sentences, path)
+            print(f"{label:<20}{elapsed:>10.2f}{report['hits']:>10}{report['misses']:>10}{report['saved_seconds']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
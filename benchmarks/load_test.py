@@ -0,0 +1,85 @@
+""" Load-test a running server.py instance and report latency percentiles per concurrency level.
+
+Start the server first (python server.py --workers 2), then from the repository root:
+    python -m benchmarks.load_test --requests 500 --concurrency 1 4 16 64
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import time
+
+from benchmarks.samples import SAMPLE_SENTENCES
+
+
+async def post(host, port, path, payload):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    if status != 200:
+        raise RuntimeError(f"{path} returned {status}: {body[:200]!r}")
+    return json.loads(body)
+
+async def get(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+async def run_level(host, port, path, total, concurrency):
+    sentences = itertools.cycle(SAMPLE_SENTENCES)
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(sentence):
+        async with semaphore:
+            start = time.perf_counter()
+            await post(host, port, path, {"sentence": sentence})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(next(sentences)) for _ in range(total)))
+    return latencies, time.perf_counter() - start
+
+async def main_async(args):
+    before = await get(args.host, args.port, "/metrics")
+    print(f"{'concurrency':>12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'mean batch':>12}")
+    for concurrency in args.concurrency:
+        latencies, elapsed = await run_level(args.host, args.port, args.path, args.requests, concurrency)
+        after = await get(args.host, args.port, "/metrics")
+        batches = after["batches"] - before["batches"]
+        mean_batch = (after["items"] - before["items"]) / batches if batches else 0.0
+        before = after
+        print(
+            f"{concurrency:>12}{len(latencies) / elapsed:>10.1f}"
+            f"{statistics.median(latencies) * 1000:>10.1f}{percentile(latencies, 99) * 1000:>10.1f}{mean_batch:>12.1f}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--path", default="/check", choices=["/check", "/tree"])
+    parser.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+""" Sample inputs shared by the benchmark scripts (no spaCy import, so clients can use them too). """
+import itertools
+
+SAMPLE_SENTENCES = [
+    "John threw the ball.",
+    "The cake was baked by Mary.",
+    "She does not like coffee.",
+    "The cat quickly ran to the park.",
+    "She went to the store, and then she went home after buying some coffee.",
+    "John and Mary went to the park.",
+    "She enjoys running.",
+    "She almost drove her kids to school every day.",
+]
+
+
+def make_corpus(n):
+    """ n distinct sentences built from the samples, so no cache can serve repeats. """
+    sentences = itertools.islice(itertools.cycle(SAMPLE_SENTENCES), n)
+    return [f"{sentence.rstrip('.')} on day {i}." for i, sentence in enumerate(sentences)]
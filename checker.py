@@ -0,0 +1,416 @@
+""" Core SVM/SVO checking logic, importable without the Streamlit UI. """
+from collections import OrderedDict
+import os
+import threading
+
+import spacy
+from spacy import displacy
+
+from metrics import incr, timed
+from rules import RuleEngine
+
+MODEL_NAME = "en_core_web_sm"
+# The checker reads dep_, pos_ and lemma_, so it needs tok2vec, tagger, parser,
+# attribute_ruler and lemmatizer. Named entities are never used.
+EXCLUDED_COMPONENTS = ["ner"]
+T5_MODEL_PATH = "./t5-small"
+TREE_OPTIONS = {"compact": True}
+# "full" renders a whole sentence; "svo" only the subject/verb/object subtrees
+TREE_MODES = ("full", "svo")
+
+_nlp = None
+_generator = None
+_rule_engine = None
+_load_lock = threading.Lock()
+
+
+def load_nlp(model=MODEL_NAME, allow_download=None):
+    """ Load the spaCy model from the local install without touching the network.
+
+    Set allow_download (or SVM_ALLOW_MODEL_DOWNLOAD=1) to fetch a missing model instead of failing.
+    """
+    if allow_download is None:
+        allow_download = os.environ.get("SVM_ALLOW_MODEL_DOWNLOAD") == "1"
+    if not spacy.util.is_package(model):
+        if not allow_download:
+            raise OSError(
+                f"spaCy model {model!r} is not installed. Install it with "
+                f"`python -m spacy download {model}` or set SVM_ALLOW_MODEL_DOWNLOAD=1."
+            )
+        import spacy.cli
+        spacy.cli.download(model)
+    with timed("model_load"):
+        return spacy.load(model, exclude=EXCLUDED_COMPONENTS)
+
+def get_nlp():
+    """ Return the shared spaCy pipeline, loading it on first use. """
+    global _nlp
+    if _nlp is None:
+        with _load_lock:
+            if _nlp is None:
+                _nlp = load_nlp()
+    return _nlp
+
+def get_generator():
+    """ Return the T5 text2text-generation pipeline, loading it only when a feature needs it. """
+    global _generator
+    if _generator is None:
+        with _load_lock:
+            if _generator is None:
+                with timed("t5_load"):
+                    from transformers import pipeline
+                    # device=-1 keeps generation on CPU
+                    _generator = pipeline("text2text-generation", model=T5_MODEL_PATH, device=-1)
+    return _generator
+
+def parse(text):
+    """ Run the pipeline on text one component at a time, timing the tokenizer and each component. """
+    nlp = get_nlp()
+    with timed("spacy.tokenizer"):
+        doc = nlp.make_doc(text)
+    for name, component in nlp.pipeline:
+        with timed(f"spacy.{name}"):
+            doc = component(doc)
+    return doc
+
+# Predefined templates for feedback
+def provide_feedback(missing_component):
+    if missing_component == "subject":
+        return """**No subject was detected.** It is advisable to include a subject in your sentence.
+        A subject answers **who** or **what** performs the action in the sentence.
+        
+        **Example**:  
+        `I went to the park.`  
+        (Here, "I" is the subject performing the action.)
+        """
+    elif missing_component == "verb":
+        return """**No verb was detected.** A verb describes the action being performed in the sentence.
+        
+        **Example**:  
+        `She ate lunch.`  
+        (Here, "ate" is the verb describing what the subject did.)
+        """
+    elif missing_component == "object":
+        return """**No object was detected.** The object receives the action of the verb.
+        
+        **Example**:  
+        `She ate the cake.`  
+        (Here, "the cake" is the object receiving the action.)
+        """
+    elif missing_component == "passive_voice":
+        return """**The sentence is in passive voice.** We suggest changing it to active voice for clearer expression.
+        
+        **Example**:  
+        `John threw the ball.`  
+        (Active voice is often more direct and clear.)
+        """
+    elif missing_component == "adverb_placement":
+        return """**The adverb is incorrectly placed.** Adverbs should generally come after the subject and verb or at the end of the sentence.
+        
+        **Example**:  
+        `She quickly ran to the park.`  
+        (Correct placement of adverb "quickly")
+        """
+    elif missing_component == "negative_sentence":
+        return """**Negative sentences detected.** It’s important to use the right placement for negations to make the sentence clear.
+        
+        **Example**:  
+        `She does not like coffee.`  
+        (Negative sentences are perfectly valid but should be placed properly for clarity.)
+        """
+    elif missing_component == "multiple_subjects":
+        return """**Multiple subjects detected.** If there are multiple subjects, ensure that the verb agrees with both subjects.
+        
+        **Example**:  
+        `John and Mary went to the park.`  
+        (This is a valid sentence, but keep subject-verb agreement in mind.)
+        """
+    elif missing_component == "complex_sentence":
+        return """**Complex sentence detected.** Consider breaking it into shorter sentences or using proper conjunctions for clarity.
+        
+        **Example**:  
+        `She went to the store, and then she went home.`  
+        (Proper punctuation and conjunctions can help make complex sentences more readable.)
+        """
+    elif missing_component == "compound_sentence":
+        return """**Compound sentence detected.** Ensure that each clause is properly connected with conjunctions and that subject-verb agreement is maintained.
+        
+        **Example**:  
+        `I went to the store, and I bought coffee.`  
+        (Use conjunctions like 'and', 'but', etc., for smooth transitions.)
+        """
+    elif missing_component == "incorrect_noun_usage":
+        return """**Incorrect noun usage detected.** Ensure that your sentence uses nouns correctly, and avoid confusion.
+        
+        **Example**:  
+        `She enjoys running.`  
+        (The gerund "running" works better here than the noun "run.")
+        """
+    elif missing_component == "double_negative":
+        return """**Double negative detected.** Double negatives can create confusion. Avoid using two negative words in the same sentence unless necessary.
+        
+        **Example**:  
+        `She doesn't need any help.`  
+        (Avoid saying "She doesn't need no help.")
+        """
+    elif missing_component == "misplaced_modifier":
+        return """**Misplaced modifier detected.** Modifiers should be placed near the word they modify to avoid confusion.
+        
+        **Example**:  
+        `She quickly ran to the store.`  
+        (The modifier "quickly" should describe the action "ran.")
+        """
+    elif missing_component == "run_on_sentence":
+        return """**Run-on sentence detected.** Consider splitting the sentence into two or more sentences or using proper punctuation.
+        
+        **Example**:  
+        `She went to the store, she bought some coffee.`  
+        (This should be two sentences: `She went to the store. She bought some coffee.`)
+        """
+    elif missing_component == "comma_splice":
+        return """**Comma splice detected.** You should avoid using commas to join independent clauses without a conjunction or semicolon.
+        
+        **Example**:  
+        `She went to the store, she bought coffee.`  
+        (Corrected: `She went to the store; she bought coffee.`)
+        """
+    elif missing_component == "inverted_order":
+        return """**The sentence order is inverted.** For NLP and SEO purposes, it is advisable to follow the standard Subject-Verb-Object (SVO) structure.
+        
+        **Example**:  
+        `She ran to the park.`  
+        (Standard order with subject "She" performing the action "ran".)
+        """
+    elif missing_component == "wrong_word_order":
+        return """**Incorrect word order detected.** It’s important to follow the correct word order for clearer writing and better SEO.
+        
+        **Example**:  
+        `The cat quickly ran to the park.`  
+        (In NLP-friendly content, adverbs should come after the verb.)
+        """
+    elif missing_component == "excessive_passive_voice":
+        return """**Excessive use of passive voice detected.** Too many passive constructions can make your content less engaging. Try using active voice for more clarity.
+        
+        **Example**:  
+        `The cake was baked by Mary.`  
+        (Rephrased to active voice: `Mary baked the cake.`)
+        """
+    else:
+        return "Error: Component type not recognized."
+
+def extract_svo_tokens(doc):
+    """ Like extract_svo(), but return the Token objects (or None) instead of their text. """
+    subject = None
+    verb = None
+    obj = None
+    
+    # Identify subject, verb, and object using dependency parsing
+    for token in doc:
+        if "subj" in token.dep_:  # Subject
+            subject = token
+        elif "VERB" in token.pos_:  # Verb
+            verb = token
+        elif "obj" in token.dep_:  # Object
+            obj = token
+    
+    return subject, verb, obj
+
+def extract_svo(doc):
+    """ Extract subject, verb, and object from the sentence using dependency parsing. """
+    return tuple(None if token is None else token.text for token in extract_svo_tokens(doc))
+
+def check_order(doc, subject, verb, obj, passive=None):
+    """ Check if the sentence follows the correct SVO order. """
+    if subject and verb and obj:
+        # Check if passive voice is detected (reuse the rule engine's answer when given)
+        if passive is None:
+            passive = any(tok.dep_ == "auxpass" for tok in doc)
+        if passive:
+            return "Passive voice detected. Suggested active sentence."
+        else:
+            return "Sentence is in correct SVM/SVO order. You can proceed."
+    else:
+        return "Something is missing from your sentence (subject, verb, or object)."
+
+def get_rule_engine():
+    """ Return the shared RuleEngine, built on the loaded pipeline's vocab. """
+    global _rule_engine
+    if _rule_engine is None:
+        vocab = get_nlp().vocab
+        with _load_lock:
+            if _rule_engine is None:
+                _rule_engine = RuleEngine(vocab)
+    return _rule_engine
+
+def feedback_for_findings(doc, subject, verb, obj, findings):
+    """ Turn rule findings into the markdown feedback shown to the user. """
+    if findings:
+        return "\n\n".join(provide_feedback(finding.rule) for finding in findings)
+    # Nothing fired, so SVO is complete and the passive_voice rule did not match
+    return check_order(doc, subject, verb, obj, passive=False)
+
+def check_doc(doc):
+    """ Extract the SVO triple, feedback and all rule findings from a parsed Doc or sentence Span. """
+    with timed("rules"):
+        subject, verb, obj, findings = get_rule_engine().run(doc)
+    with timed("feedback"):
+        feedback = feedback_for_findings(doc, subject, verb, obj, findings)
+    return subject, verb, obj, feedback, findings
+
+class Analysis:
+    """ One parse of a sentence plus everything derived from it (SVO triple, feedback, displaCy HTML). """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.subject, self.verb, self.obj, self.feedback, self.findings = check_doc(doc)
+        self._html = None
+
+    @property
+    def svo(self):
+        return self.subject, self.verb, self.obj
+
+    @property
+    def sentences(self):
+        return list(self.doc.sents)
+
+    @property
+    def html(self):
+        # Rendered on first use so feedback-only callers never pay for it.
+        if self._html is None:
+            with timed("displacy_render"):
+                self._html = displacy.render(self.doc, style="dep", options=TREE_OPTIONS, jupyter=False)
+        return self._html
+
+def _svo_tree_html(sent):
+    """ Render only the subject and object subtrees plus the verb, via displaCy's manual mode. """
+    subject, verb, obj = extract_svo_tokens(sent)
+    tokens = set()
+    for head in (subject, obj):
+        if head is not None:
+            tokens.update(head.subtree)
+    if verb is not None:
+        tokens.add(verb)
+    if not tokens:
+        return None
+    ordered = sorted(tokens, key=lambda token: token.i)
+    position = {token.i: index for index, token in enumerate(ordered)}
+    words = [{"text": token.text, "tag": token.pos_} for token in ordered]
+    arcs = []
+    for token in ordered:
+        head = position.get(token.head.i)
+        if head is None or token.head.i == token.i:
+            continue
+        child = position[token.i]
+        if child < head:
+            arcs.append({"start": child, "end": head, "label": token.dep_, "dir": "left"})
+        else:
+            arcs.append({"start": head, "end": child, "label": token.dep_, "dir": "right"})
+    return displacy.render({"words": words, "arcs": arcs}, style="dep", manual=True, options=TREE_OPTIONS, jupyter=False)
+
+def _sentence_tree_html(sent, mode):
+    with timed("displacy_render"):
+        html = _svo_tree_html(sent) if mode == "svo" else None
+        if html is None:
+            html = displacy.render(sent, style="dep", options=TREE_OPTIONS, jupyter=False)
+    return html
+
+class BoundedLRU:
+    """ Thread-safe LRU of at most maxsize values, counting hits and misses.
+
+    Values are built outside the lock, so a slow parse or render doesn't block other lookups.
+    With a metric name, hits and misses are also counted as <metric>_hits/_misses.
+    """
+
+    def __init__(self, maxsize, metric=None):
+        self.maxsize = maxsize
+        self.metric = metric
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, create):
+        """ Return the value for key, calling create() to build and store it on a miss. """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if value is not None:
+            if self.metric:
+                incr(f"{self.metric}_hits")
+            return value
+        if self.metric:
+            incr(f"{self.metric}_misses")
+        value = create()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+def _parse_key(sent):
+    """ What a rendered tree depends on: each token's text, POS, label and head (relative to the sentence). """
+    return tuple((token.text, token.pos_, token.dep_, token.head.i - sent.start) for token in sent)
+
+class TreeCache(BoundedLRU):
+    """ Bounded LRU of rendered syntax-tree HTML keyed on (sentence parse, mode).
+
+    The same text parsed alone and inside a document can get different trees, so the
+    key is the parse itself rather than the text.
+    """
+
+    def __init__(self, maxsize=256):
+        super().__init__(maxsize)
+
+    def get(self, sent, mode="full"):
+        if mode not in TREE_MODES:
+            raise ValueError(f"Unknown tree mode {mode!r}; expected one of {TREE_MODES}")
+        return self.lookup((_parse_key(sent), mode), lambda: _sentence_tree_html(sent, mode))
+
+tree_cache = TreeCache()
+
+def render_sentence_tree(sent, mode="full"):
+    """ Memoized tree for one sentence Span: the whole sentence ("full") or just its SVO subtrees ("svo"). """
+    return tree_cache.get(sent, mode)
+
+def normalize_sentence(sentence):
+    """ Collapse whitespace so trivially different submissions share a cache entry. """
+    return " ".join(sentence.split())
+
+class AnalysisCache(BoundedLRU):
+    """ Bounded LRU cache of Analysis objects keyed on normalized sentence text. """
+
+    def __init__(self, maxsize=512):
+        super().__init__(maxsize, metric="analysis_cache")
+
+    def get(self, sentence):
+        key = normalize_sentence(sentence)
+        return self.lookup(key, lambda: Analysis(parse(key)))
+
+analysis_cache = AnalysisCache()
+
+def analyze(sentence):
+    """ Return the (possibly cached) Analysis for a sentence, parsing it at most once. """
+    return analysis_cache.get(sentence)
+
+def process_sentence(sentence):
+    """ Main function to process and convert sentence into SVM format. """
+    with timed("process_sentence"):
+        return analyze(sentence).feedback
+
+def render_syntax_tree(sentence):
+    with timed("render_syntax_tree"):
+        return analyze(sentence).html
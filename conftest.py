@@ -0,0 +1 @@
+""" Puts the repository root on sys.path so tests and benchmarks can import the top-level modules. """
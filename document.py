@@ -0,0 +1,108 @@
+""" Document mode: split long text into sentences and check each one with character offsets.
+
+Text is cut into paragraph-aligned chunks of at most max_chars and streamed through
+nlp.pipe, so memory stays bounded by the chunk size however long the article is.
+"""
+import argparse
+import re
+import sys
+
+from batch import write_jsonl
+from checker import check_doc, get_nlp
+from rewrite import add_rewrite_arguments, rewrites_from_args
+
+DEFAULT_MAX_CHARS = 10000
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"[.!?]\s+")
+
+
+def _split_long(text, offset, max_chars):
+    """ Split an oversized paragraph at sentence ends, falling back to whitespace. """
+    while len(text) > max_chars:
+        window = text[:max_chars]
+        ends = [match.end() for match in _SENTENCE_END.finditer(window)]
+        cut = ends[-1] if ends else window.rfind(" ") + 1
+        if cut <= 0:
+            cut = max_chars
+        yield offset, text[:cut]
+        text = text[cut:]
+        offset += cut
+    if text:
+        yield offset, text
+
+def iter_chunks(text, max_chars=DEFAULT_MAX_CHARS):
+    """ Yield (char_offset, chunk) pairs covering text, breaking only between paragraphs where possible. """
+    chunk_start = None
+    chunk_end = 0
+    position = 0
+    for match in list(_PARAGRAPH_BREAK.finditer(text)) + [None]:
+        end = match.start() if match else len(text)
+        next_position = match.end() if match else len(text)
+        if end > position:
+            if chunk_start is not None and end - chunk_start > max_chars:
+                yield from _split_long(text[chunk_start:chunk_end], chunk_start, max_chars)
+                chunk_start = None
+            if chunk_start is None:
+                chunk_start = position
+            chunk_end = end
+        position = next_position
+    if chunk_start is not None:
+        yield from _split_long(text[chunk_start:chunk_end], chunk_start, max_chars)
+
+def check_document(text, max_chars=DEFAULT_MAX_CHARS, batch_size=4, with_spans=False):
+    """ Check every sentence in text, yielding one result dict per sentence with character offsets.
+
+    With with_spans, yield (result, sentence Span) pairs instead, so callers can render
+    the parse the result came from without parsing the sentence again.
+    """
+    chunks = ((chunk, offset) for offset, chunk in iter_chunks(text, max_chars))
+    for doc, offset in get_nlp().pipe(chunks, as_tuples=True, batch_size=batch_size):
+        for sent in doc.sents:
+            if not sent.text.strip():
+                continue
+            subject, verb, obj, feedback, findings = check_doc(sent)
+            result = {
+                "sentence": sent.text,
+                "start_char": offset + sent.start_char,
+                "end_char": offset + sent.end_char,
+                "subject": subject,
+                "verb": verb,
+                "object": obj,
+                "feedback": feedback,
+                "findings": [
+                    {
+                        "rule": finding.rule,
+                        "start_char": None if finding.start is None else offset + doc[finding.start].idx,
+                        "end_char": None if finding.end is None else offset + doc[finding.start:finding.end].end_char,
+                    }
+                    for finding in findings
+                ],
+            }
+            yield (result, sent) if with_spans else result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check a whole document sentence by sentence and write JSONL results.")
+    parser.add_argument("input", nargs="?", default="-", help="input text file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file, or - for stdout (default)")
+    parser.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="maximum characters parsed at once")
+    add_rewrite_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.input, encoding="utf-8") as src:
+            text = src.read()
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        results = rewrites_from_args(check_document(text, max_chars=args.max_chars), args)
+        count = write_jsonl(results, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Checked {count} sentences.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+""" Stage timers, counters and an optional profiler for the checking pipeline.
+
+    with timed("parser"):
+        ...
+    incr("analysis_cache_hits")
+
+Snapshots export as a JSON-ready dict (snapshot()) or Prometheus text (to_prometheus()).
+"""
+from contextlib import contextmanager
+import cProfile
+import io
+import pstats
+import threading
+import time
+
+_lock = threading.Lock()
+_stages = {}
+_counters = {}
+
+
+def record(stage, seconds):
+    """ Add one timed call of stage. """
+    with _lock:
+        calls, total, slowest = _stages.get(stage, (0, 0.0, 0.0))
+        _stages[stage] = (calls + 1, total + seconds, max(slowest, seconds))
+
+@contextmanager
+def timed(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+def incr(name, amount=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def snapshot(reset=False):
+    """ Return {"stages": {...}, "counters": {...}}, optionally clearing the registry. """
+    with _lock:
+        stages = {
+            stage: {"calls": calls, "seconds": total, "max_seconds": slowest}
+            for stage, (calls, total, slowest) in _stages.items()
+        }
+        counters = dict(_counters)
+        if reset:
+            _stages.clear()
+            _counters.clear()
+    return {"stages": stages, "counters": counters}
+
+def merge(other):
+    """ Fold a snapshot taken in another process (e.g. a server worker) into this registry. """
+    with _lock:
+        for stage, values in other["stages"].items():
+            calls, total, slowest = _stages.get(stage, (0, 0.0, 0.0))
+            _stages[stage] = (calls + values["calls"], total + values["seconds"], max(slowest, values["max_seconds"]))
+        for name, value in other["counters"].items():
+            _counters[name] = _counters.get(name, 0) + value
+
+def to_prometheus(prefix="svm"):
+    """ Render the registry in the Prometheus text exposition format. """
+    data = snapshot()
+    lines = [
+        f"# HELP {prefix}_stage_seconds_total Time spent in each pipeline stage.",
+        f"# TYPE {prefix}_stage_seconds_total counter",
+    ]
+    lines += [f'{prefix}_stage_seconds_total{{stage="{stage}"}} {values["seconds"]:.6f}' for stage, values in sorted(data["stages"].items())]
+    lines += [
+        f"# HELP {prefix}_stage_calls_total Number of times each pipeline stage ran.",
+        f"# TYPE {prefix}_stage_calls_total counter",
+    ]
+    lines += [f'{prefix}_stage_calls_total{{stage="{stage}"}} {values["calls"]}' for stage, values in sorted(data["stages"].items())]
+    lines += [
+        f"# HELP {prefix}_stage_max_seconds Slowest single call of each pipeline stage.",
+        f"# TYPE {prefix}_stage_max_seconds gauge",
+    ]
+    lines += [f'{prefix}_stage_max_seconds{{stage="{stage}"}} {values["max_seconds"]:.6f}' for stage, values in sorted(data["stages"].items())]
+    for name, value in sorted(data["counters"].items()):
+        lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+    return "\n".join(lines) + "\n"
+
+class Profile:
+    """ Holds the text report once a profiled() block has finished. """
+
+    def __init__(self):
+        self.report = ""
+
+@contextmanager
+def profiled(enabled=True, engine="cprofile", limit=30):
+    """ Profile the enclosed block with cProfile or pyinstrument (if installed); a no-op when disabled. """
+    profile = Profile()
+    if not enabled:
+        yield profile
+        return
+    if engine == "pyinstrument":
+        from pyinstrument import Profiler
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield profile
+        finally:
+            profiler.stop()
+            profile.report = profiler.output_text()
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profile
+    finally:
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+        profile.report = out.getvalue()
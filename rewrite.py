@@ -0,0 +1,170 @@
+""" T5 rewrite suggestions for passive or complex sentences, batched and cached on disk.
+
+Rewrites are keyed by model, generation settings and sentence in a SQLite file, so
+re-running a report on unchanged content never calls the model again. The model part
+of the key follows the files in the model directory, so replacing or fine-tuning the
+weights retires the old rewrites.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+
+from checker import T5_MODEL_PATH, get_generator
+
+DEFAULT_CACHE_PATH = os.path.join(".svm_cache", "rewrites.sqlite3")
+# Findings that get a rewrite suggestion, and the instruction given to T5 for each
+REWRITE_PROMPTS = {
+    "passive_voice": "Rewrite in active voice: ",
+    "complex_sentence": "Simplify: ",
+}
+
+
+def model_identity(path=T5_MODEL_PATH):
+    """ Identify the model at path: a hash of its JSON configs plus the size and mtime of every other file.
+
+    Paths that aren't local directories (e.g. hub model names) are used as-is.
+    """
+    if not os.path.isdir(path):
+        return path
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(path)):
+        file_path = os.path.join(path, name)
+        if not os.path.isfile(file_path):
+            continue
+        digest.update(name.encode("utf-8") + b"\0")
+        if name.endswith(".json"):
+            with open(file_path, "rb") as config:
+                digest.update(config.read())
+        else:
+            # Weight files are too large to hash on every call
+            stat = os.stat(file_path)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("ascii"))
+        digest.update(b"\0")
+    return f"{path}@{digest.hexdigest()[:16]}"
+
+class RewriteSettings:
+    """ Generation options; part of the cache key because they change the output. """
+
+    def __init__(self, max_new_tokens=64, num_beams=4, batch_size=8):
+        self.max_new_tokens = max_new_tokens
+        self.num_beams = num_beams
+        self.batch_size = batch_size
+
+    def key(self):
+        return f"max_new_tokens={self.max_new_tokens};num_beams={self.num_beams}"
+
+class RewriteCache:
+    """ Persistent SQLite cache of generated rewrites. """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rewrites (key TEXT PRIMARY KEY, model TEXT, prompt TEXT, rewrite TEXT)"
+            )
+
+    @staticmethod
+    def make_key(model, settings, prompt):
+        return hashlib.sha256(f"{model}\0{settings.key()}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys):
+        found = {}
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute("SELECT rewrite FROM rewrites WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    found[key] = row[0]
+        return found
+
+    def put_many(self, entries):
+        """ Store (key, model, prompt, rewrite) tuples. """
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO rewrites VALUES (?, ?, ?, ?)", entries)
+
+    def close(self):
+        self._conn.close()
+
+def _generate(prompts, settings):
+    """ Run T5 on prompts in batches of settings.batch_size. """
+    outputs = get_generator()(
+        prompts,
+        batch_size=settings.batch_size,
+        max_new_tokens=settings.max_new_tokens,
+        num_beams=settings.num_beams,
+    )
+    # The pipeline returns one dict per prompt (or a one-item list when it doesn't flatten)
+    return [(output[0] if isinstance(output, list) else output)["generated_text"].strip() for output in outputs]
+
+def suggest_rewrites(requests, settings=None, cache=None, model=None):
+    """ Return one rewrite per (sentence, rule) request, generating only what the cache lacks.
+
+    model is the cache identity of the T5 model; it defaults to model_identity().
+    """
+    settings = settings or RewriteSettings()
+    model = model or model_identity()
+    prompts = [REWRITE_PROMPTS[rule] + sentence for sentence, rule in requests]
+    keys = [RewriteCache.make_key(model, settings, prompt) for prompt in prompts]
+    found = cache.get_many(set(keys)) if cache is not None else {}
+
+    missing = {}
+    for key, prompt in zip(keys, prompts):
+        if key not in found:
+            missing.setdefault(key, prompt)
+    if missing:
+        generated = _generate(list(missing.values()), settings)
+        new_entries = dict(zip(missing, generated))
+        found.update(new_entries)
+        if cache is not None:
+            cache.put_many([(key, model, missing[key], rewrite) for key, rewrite in new_entries.items()])
+    return [found[key] for key in keys]
+
+def rewrite_rule(rules):
+    """ Pick the finding a sentence should be rewritten for, or None if none qualifies. """
+    for rule in REWRITE_PROMPTS:
+        if rule in rules:
+            return rule
+    return None
+
+def add_rewrites(results, settings=None, cache=None, group_size=64):
+    """ Attach a "rewrite" to each flagged result dict, generating in groups of group_size results. """
+    group = []
+    for result in results:
+        group.append(result)
+        if len(group) >= group_size:
+            yield from _rewrite_group(group, settings, cache)
+            group = []
+    if group:
+        yield from _rewrite_group(group, settings, cache)
+
+def _rewrite_group(group, settings, cache):
+    flagged = []
+    for result in group:
+        # batch.py reports rule names, document.py reports finding dicts
+        rules = [finding["rule"] if isinstance(finding, dict) else finding for finding in result["findings"]]
+        rule = rewrite_rule(rules)
+        if rule is not None:
+            flagged.append((result, rule))
+    if flagged:
+        rewrites = suggest_rewrites([(result["sentence"], rule) for result, rule in flagged], settings, cache)
+        for (result, _), rewrite in zip(flagged, rewrites):
+            result["rewrite"] = rewrite
+    return group
+
+def add_rewrite_arguments(parser):
+    """ Add the shared --rewrite options to a CLI parser. """
+    parser.add_argument("--rewrite", action="store_true", help="suggest T5 rewrites for passive or complex sentences")
+    parser.add_argument("--max-new-tokens", type=int, default=64, help="longest rewrite T5 may generate")
+    parser.add_argument("--num-beams", type=int, default=4, help="beam search width for rewrites")
+    parser.add_argument("--rewrite-batch-size", type=int, default=8, help="sentences per T5 generation batch")
+    parser.add_argument("--rewrite-cache", default=DEFAULT_CACHE_PATH, help="SQLite file caching rewrites")
+
+def rewrites_from_args(results, args):
+    """ Wrap results with add_rewrites() when --rewrite was given. """
+    if not args.rewrite:
+        return results
+    settings = RewriteSettings(args.max_new_tokens, args.num_beams, args.rewrite_batch_size)
+    return add_rewrites(results, settings, RewriteCache(args.rewrite_cache))
@@ -0,0 +1,209 @@
+""" Declarative feedback rules evaluated in a single pass over a parsed sentence.
+
+Each rule names the provide_feedback() component it reports and matches on token
+attributes (dep_, pos_, lemma_), either through a token predicate or spaCy Matcher
+patterns. RuleEngine walks the tokens once, runs one Matcher call for all pattern
+rules, and returns every rule that fired, in registry order.
+"""
+from collections import namedtuple
+import hashlib
+import time
+import types
+
+from spacy.matcher import Matcher
+
+Finding = namedtuple("Finding", ["rule", "count", "start", "end"])
+
+# Negatives counted towards a double negative besides dep_ == "neg" ("not", "n't", "never").
+# "neither ... nor" and a leading "No," are deliberately not counted.
+NEGATIVE_DETERMINERS = {"no"}
+NEGATIVE_PRONOUNS = {"nothing", "nobody", "none", "noone"}
+LIMITING_MODIFIERS = {"almost", "only", "just", "nearly", "merely", "barely", "hardly"}
+# Verbs that take a gerund ("enjoys running") rather than a bare verb or infinitive
+GERUND_VERBS = ["enjoy", "avoid", "finish", "mind", "consider", "suggest", "keep", "practice", "quit"]
+COMPLEX_WORD_LIMIT = 10
+
+
+class Rule:
+    """ One feedback rule: a token predicate or Matcher patterns plus a trigger condition.
+
+    The rule fires when at least min_count tokens/matches are found, or, for absent
+    rules, when none are.
+    """
+
+    def __init__(self, name, token=None, patterns=None, min_count=1, absent=False):
+        self.name = name
+        self.token = token
+        self.patterns = patterns
+        self.min_count = min_count
+        self.absent = absent
+
+    def triggered(self, count):
+        if self.absent:
+            return count == 0
+        return count >= self.min_count
+
+def _is_subject(token):
+    return "subj" in token.dep_
+
+def _is_verb(token):
+    return token.pos_ == "VERB"
+
+def _is_object(token):
+    return "obj" in token.dep_
+
+def _is_coordinated_subject(token):
+    # "John and Mary went": the subject "John" has "Mary" as a conj child
+    return _is_subject(token) and any(child.dep_ == "conj" for child in token.children)
+
+def _is_negation(token):
+    if token.dep_ == "neg":
+        return True
+    if token.lower_ in NEGATIVE_DETERMINERS:
+        return token.pos_ == "DET"
+    return token.lower_ in NEGATIVE_PRONOUNS and token.pos_ in ("PRON", "NOUN")
+
+def _is_coordinated_clause(token):
+    return (
+        token.dep_ == "conj"
+        and token.pos_ in ("VERB", "AUX")
+        and any(_is_subject(child) for child in token.children)
+    )
+
+def _is_misplaced_modifier(token):
+    return token.lower_ in LIMITING_MODIFIERS and token.dep_ == "advmod" and token.head.pos_ == "VERB"
+
+def _is_comma_splice(token):
+    # A clause with its own subject joined to the previous one by a bare comma
+    if token.pos_ not in ("VERB", "AUX") or token.dep_ not in ("conj", "ccomp", "parataxis"):
+        return False
+    if not any(_is_subject(child) for child in token.children):
+        return False
+    left = token.left_edge.i - 1
+    return left >= 0 and token.doc[left].text == ","
+
+def _is_counted_word(token):
+    return not (token.is_punct or token.is_space)
+
+# Registry order matches the priority of the original feedback chain
+RULES = [
+    Rule("subject", token=_is_subject, absent=True),
+    Rule("verb", token=_is_verb, absent=True),
+    Rule("object", token=_is_object, absent=True),
+    Rule("negative_sentence", token=lambda token: token.dep_ == "neg"),
+    Rule("multiple_subjects", token=_is_coordinated_subject),
+    Rule("adverb_placement", patterns=[
+        [{"POS": "ADV", "DEP": "advmod", "LOWER": {"REGEX": "ly$"}}, {"POS": "VERB"}],
+    ]),
+    Rule("complex_sentence", token=_is_counted_word, min_count=COMPLEX_WORD_LIMIT + 1),
+    Rule("passive_voice", token=lambda token: token.dep_ == "auxpass"),
+    Rule("compound_sentence", token=_is_coordinated_clause),
+    Rule("incorrect_noun_usage", patterns=[
+        [{"LEMMA": {"IN": GERUND_VERBS}}, {"TAG": {"IN": ["VB", "VBP"]}}],
+        [{"LEMMA": {"IN": GERUND_VERBS}}, {"LOWER": "to"}, {"POS": "VERB"}],
+    ]),
+    Rule("double_negative", token=_is_negation, min_count=2),
+    Rule("misplaced_modifier", token=_is_misplaced_modifier),
+    Rule("comma_splice", token=_is_comma_splice),
+]
+
+
+def _code_parts(code, func_globals, seen):
+    """ Bytecode, constants and referenced module-level helpers/data of a code object, as stable strings. """
+    parts = [code.co_code.hex()]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            parts += _code_parts(const, func_globals, seen)
+        elif isinstance(const, (set, frozenset)):
+            parts.append(repr(sorted(const, key=repr)))
+        else:
+            parts.append(repr(const))
+    for name in code.co_names:
+        if name in seen or name not in func_globals:
+            continue
+        seen.add(name)
+        value = func_globals[name]
+        if isinstance(value, types.FunctionType):
+            parts += _code_parts(value.__code__, value.__globals__, seen)
+        elif isinstance(value, (set, frozenset)):
+            parts.append(f"{name}={sorted(value, key=repr)!r}")
+        elif isinstance(value, (str, int, float, bool, list, tuple, dict)):
+            parts.append(f"{name}={value!r}")
+    return parts
+
+def code_fingerprint(*funcs):
+    """ Hash of the given functions' code, following the helpers and word lists they use.
+
+    Any change to their logic or text changes the hash (so does a Python upgrade, which
+    changes bytecode); comments and formatting do not.
+    """
+    parts = []
+    for func in funcs:
+        if func is None:
+            parts.append("None")
+            continue
+        parts += _code_parts(func.__code__, func.__globals__, set())
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def rules_fingerprint(rules=None):
+    """ Hash of the rule registry: names, patterns, thresholds and predicate code. """
+    parts = []
+    for rule in RULES if rules is None else rules:
+        parts.append(f"{rule.name}|{code_fingerprint(rule.token)}|{rule.patterns!r}|{rule.min_count}|{rule.absent}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class RuleEngine:
+    """ Evaluate a rule registry against a Doc or sentence Span in one pass. """
+
+    def __init__(self, vocab, rules=None):
+        self.rules = list(RULES if rules is None else rules)
+        self.matcher = Matcher(vocab)
+        self._token_rules = [rule for rule in self.rules if rule.token is not None]
+        for rule in self.rules:
+            if rule.patterns:
+                self.matcher.add(rule.name, rule.patterns)
+
+    def run(self, doc, timings=None):
+        """ Return (subject, verb, obj, findings) for doc.
+
+        The SVO triple follows extract_svo(): the last subject, verb and object seen.
+        Pass a dict as timings to accumulate seconds spent per rule.
+        """
+        subject = verb = obj = None
+        counts = {rule.name: 0 for rule in self.rules}
+        spans = {}
+
+        for token in doc:
+            if "subj" in token.dep_:
+                subject = token.text
+            elif "VERB" in token.pos_:
+                verb = token.text
+            elif "obj" in token.dep_:
+                obj = token.text
+
+            for rule in self._token_rules:
+                if timings is None:
+                    hit = rule.token(token)
+                else:
+                    start = time.perf_counter()
+                    hit = rule.token(token)
+                    timings[rule.name] = timings.get(rule.name, 0.0) + time.perf_counter() - start
+                if hit:
+                    counts[rule.name] += 1
+                    spans.setdefault(rule.name, (token.i, token.i + 1))
+
+        start = time.perf_counter() if timings is not None else None
+        # as_spans keeps offsets relative to the Doc when a sentence Span is passed in
+        for span in self.matcher(doc, as_spans=True):
+            counts[span.label_] += 1
+            spans.setdefault(span.label_, (span.start, span.end))
+        if timings is not None:
+            timings["matcher"] = timings.get("matcher", 0.0) + time.perf_counter() - start
+
+        findings = []
+        for rule in self.rules:
+            if rule.triggered(counts[rule.name]):
+                match_start, match_end = spans.get(rule.name, (None, None))
+                findings.append(Finding(rule.name, counts[rule.name], match_start, match_end))
+        return subject, verb, obj, findings
@@ -0,0 +1,252 @@
+""" Local asyncio HTTP API around the checker, with a micro-batching scheduler.
+
+Concurrent requests are gathered into short time-windowed batches and parsed with
+nlp.pipe in a pool of worker processes, each holding its own spaCy pipeline.
+
+    POST /check   {"sentence": "..."}  -> sentence, subject, verb, object, feedback, findings (as batch.py)
+    POST /tree    {"sentence": "..."}  -> {"html": "<displaCy SVG>"}
+    GET  /metrics                      -> queue, batch and pipeline stage metrics (JSON)
+    GET  /metrics/prometheus           -> the same metrics in Prometheus text format
+    GET  /health                       -> {"status": "ok"}
+
+Add ?profile=1 to /check or /tree to get a cProfile report of the worker batch.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+import json
+import sys
+import time
+
+from spacy import displacy
+
+from batch import result_for_doc
+from checker import TREE_OPTIONS, get_nlp
+import metrics
+
+MAX_BODY_BYTES = 1 << 20
+
+
+def analyze_batch(items):
+    """ Parse a batch of (sentence, render, profile) items with one nlp.pipe call. Runs in a worker process.
+
+    Returns the results plus the worker's metrics since the last batch, for the server to merge.
+    """
+    results = []
+    with metrics.profiled(any(profile for _, _, profile in items)) as profile_report:
+        with metrics.timed("worker_batch"):
+            docs = get_nlp().pipe(sentence for sentence, _, _ in items)
+            for doc, (_, render, _) in zip(docs, items):
+                # Same result shape as the batch CLI
+                result = result_for_doc(doc)
+                if render:
+                    with metrics.timed("displacy_render"):
+                        result["html"] = displacy.render(doc, style="dep", options=TREE_OPTIONS, jupyter=False)
+                results.append(result)
+    for (_, _, profile), result in zip(items, results):
+        if profile:
+            result["profile"] = profile_report.report
+    return results, metrics.snapshot(reset=True)
+
+class MicroBatcher:
+    """ Collect submissions for up to window seconds (or max_batch items) and run them as one batch. """
+
+    def __init__(self, executor, workers, window=0.005, max_batch=64):
+        self.executor = executor
+        self.workers = workers
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+        self.batches = 0
+        self.items = 0
+        self.max_queue_depth = 0
+        self.batch_sizes = {}
+        self._tasks = []
+
+    def start(self):
+        # One collector per worker keeps every worker busy while the next batch fills
+        self._tasks = [asyncio.create_task(self._collect()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def submit(self, sentence, render=False, profile=False):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((sentence, render, profile, future))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._record(len(batch))
+            items = [(sentence, render, profile) for sentence, render, profile, _ in batch]
+            try:
+                results, worker_metrics = await loop.run_in_executor(self.executor, analyze_batch, items)
+            except Exception as exc:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            metrics.merge(worker_metrics)
+            for (*_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _record(self, size):
+        self.batches += 1
+        self.items += size
+        self.batch_sizes[size] = self.batch_sizes.get(size, 0) + 1
+
+    def metrics(self):
+        return {
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "batch_sizes": {str(size): count for size, count in sorted(self.batch_sizes.items())},
+        }
+
+class CheckerServer:
+    """ Minimal HTTP/1.1 server (one request per connection) in front of a MicroBatcher. """
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.requests = 0
+        self.started = time.time()
+
+    async def handle(self, reader, writer):
+        try:
+            with metrics.timed("http_request"):
+                status, payload = await self._dispatch(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        except Exception as exc:
+            status, payload = 500, {"error": str(exc)}
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        writer.write(
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) < 2:
+            return 400, {"error": "malformed request line"}
+        method = request_line[0]
+        path, _, query = request_line[1].partition("?")
+        profile = "profile=1" in query.split("&")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        self.requests += 1
+
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, dict(self.server_metrics(), **metrics.snapshot())
+        if path == "/metrics/prometheus":
+            gauges = []
+            for name, value in self.server_metrics().items():
+                if name != "batch_sizes":
+                    gauges += [f"# TYPE svm_server_{name} gauge", f"svm_server_{name} {value}"]
+            return 200, metrics.to_prometheus() + "\n".join(gauges) + "\n"
+        if path not in ("/check", "/tree"):
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            return 400, {"error": "invalid Content-Length"}
+        if length > MAX_BODY_BYTES:
+            return 413, {"error": "request body too large"}
+        try:
+            sentence = json.loads(await reader.readexactly(length))["sentence"]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": 'expected a JSON body like {"sentence": "..."}'}
+        if not isinstance(sentence, str) or not sentence.strip():
+            return 400, {"error": "sentence must be a non-empty string"}
+
+        result = await self.batcher.submit(sentence, render=path == "/tree", profile=profile)
+        if path == "/tree":
+            return 200, {key: result[key] for key in ("html", "profile") if key in result}
+        return 200, result
+
+    def server_metrics(self):
+        return dict(self.batcher.metrics(), requests=self.requests, uptime=time.time() - self.started)
+
+def _warm_worker():
+    """ Load the pipeline in a worker; the short sleep makes concurrent calls land on different workers. """
+    get_nlp()
+    time.sleep(0.2)
+
+async def serve(host, port, workers, window, max_batch):
+    # Load once in the parent so a missing model fails here, and forked workers inherit it
+    get_nlp()
+    with ProcessPoolExecutor(max_workers=workers, initializer=get_nlp) as executor:
+        # Start every worker before listening: a worker forked mid-request would inherit
+        # that client's socket and keep it open after the parent closes it
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, _warm_worker) for _ in range(workers)))
+        batcher = MicroBatcher(executor, workers, window=window, max_batch=max_batch)
+        batcher.start()
+        server = await asyncio.start_server(CheckerServer(batcher).handle, host, port)
+        print(f"Serving on http://{host}:{port} with {workers} worker(s)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await batcher.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the SVM checker over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2, help="worker processes running nlp.pipe")
+    parser.add_argument("--window-ms", type=float, default=5.0, help="how long to wait while filling a batch")
+    parser.add_argument("--max-batch", type=int, default=64, help="largest batch sent to a worker")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.window_ms / 1000, args.max_batch))
+    except OSError as exc:
+        print(f"Cannot start server: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+""" Persistent, content-addressed store of parsed sentences for incremental re-checking.
+
+Each entry is keyed by the SHA-256 of the sentence text and holds the serialized
+spaCy Doc (DocBin) plus the checker's result dict. The store remembers which spaCy
+model, rule set and feedback templates produced its entries and drops them all when
+any of them changes.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from spacy.tokens import DocBin
+
+from checker import EXCLUDED_COMPONENTS, check_order, feedback_for_findings, provide_feedback
+from rules import code_fingerprint, rules_fingerprint
+
+DEFAULT_STORE_PATH = os.path.join(".svm_cache", "analyses.sqlite3")
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def model_version(nlp):
+    """ Identify the loaded pipeline: package name, version and active components. """
+    meta = nlp.meta
+    return f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}:{','.join(nlp.pipe_names)}:-{','.join(EXCLUDED_COMPONENTS)}"
+
+class AnalysisStore:
+    """ SQLite-backed store of (DocBin bytes, result) per sentence, with hit/miss and timing counters. """
+
+    def __init__(self, nlp, path=DEFAULT_STORE_PATH, store_docs=True):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.nlp = nlp
+        self.path = path
+        self.store_docs = store_docs
+        # Stored results include the feedback text, so its templates are part of the version too
+        feedback = code_fingerprint(provide_feedback, check_order, feedback_for_findings)
+        self.version = f"{model_version(nlp)}|rules={rules_fingerprint()}|feedback={feedback}"
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.parse_seconds = 0.0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS analyses (key TEXT PRIMARY KEY, doc BLOB, result TEXT)")
+        self._check_version()
+
+    def _meta(self, name, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return default if row is None else row[0]
+
+    def _set_meta(self, name, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, str(value)))
+
+    def _check_version(self):
+        with self._lock, self._conn:
+            if self._meta("version") != self.version:
+                self.invalidated = self._conn.execute("DELETE FROM analyses").rowcount
+                self._conn.execute("DELETE FROM meta")
+                self._set_meta("version", self.version)
+
+    def get_many(self, texts):
+        """ Return {text: result} for every text already in the store. """
+        found = {}
+        with self._lock:
+            for text in texts:
+                row = self._conn.execute("SELECT result FROM analyses WHERE key = ?", (text_key(text),)).fetchone()
+                if row is not None:
+                    found[text] = json.loads(row[0])
+        self.hits += len(found)
+        return found
+
+    def put_many(self, entries, parse_seconds=0.0):
+        """ Store (doc, result) pairs; parse_seconds is the time spent producing them. """
+        rows = []
+        for doc, result in entries:
+            blob = DocBin(docs=[doc], store_user_data=False).to_bytes() if self.store_docs else None
+            rows.append((text_key(doc.text), blob, json.dumps(result, ensure_ascii=False)))
+        self.misses += len(rows)
+        self.parse_seconds += parse_seconds
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO analyses VALUES (?, ?, ?)", rows)
+            if rows and parse_seconds:
+                # Running per-sentence cost, so a fully cached run can still estimate savings
+                parsed = int(self._meta("parsed", 0)) + len(rows)
+                seconds = float(self._meta("parse_seconds", 0.0)) + parse_seconds
+                self._set_meta("parsed", parsed)
+                self._set_meta("parse_seconds", seconds)
+
+    def load_doc(self, text):
+        """ Rebuild the stored Doc for text, or None if it isn't stored. """
+        with self._lock:
+            row = self._conn.execute("SELECT doc FROM analyses WHERE key = ?", (text_key(text),)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return next(DocBin().from_bytes(row[0]).get_docs(self.nlp.vocab))
+
+    def seconds_per_sentence(self):
+        with self._lock:
+            parsed = int(self._meta("parsed", 0))
+            seconds = float(self._meta("parse_seconds", 0.0))
+        return seconds / parsed if parsed else 0.0
+
+    def report(self):
+        """ Summarize this run: reuse counts and the parse time the store saved. """
+        per_sentence = self.seconds_per_sentence()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "parse_seconds": self.parse_seconds,
+            "seconds_per_sentence": per_sentence,
+            "saved_seconds": self.hits * per_sentence,
+        }
+
+    def close(self):
+        self._conn.close()
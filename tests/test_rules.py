@@ -0,0 +1,51 @@
+""" Pin the rule engine's semantics: one sentence that must fire each rule and one that must not. """
+import pytest
+
+spacy = pytest.importorskip("spacy")
+if not spacy.util.is_package("en_core_web_sm"):
+    pytest.skip("en_core_web_sm is not installed", allow_module_level=True)
+
+from checker import get_nlp, get_rule_engine  # noqa: E402
+from rules import RULES, Rule, rules_fingerprint  # noqa: E402
+
+CASES = [
+    ("subject", "Go to the park.", "John threw the ball."),
+    ("verb", "The big red ball.", "John threw the ball."),
+    ("object", "She sleeps.", "John threw the ball."),
+    ("negative_sentence", "She does not like coffee.", "She likes coffee."),
+    ("multiple_subjects", "John and Mary bought a car.", "She went to the store, and then she went home."),
+    ("multiple_subjects", "John and Mary bought a car.", "The man who left forgot his keys."),
+    ("multiple_subjects", "John and Mary bought a car.", "I think that she left."),
+    ("adverb_placement", "The cat quickly ran to the park.", "The cat ran to the park."),
+    ("complex_sentence", "The committee decided that the budget would be reviewed again by an auditor.", "John threw the ball."),
+    ("passive_voice", "The cake was baked by Mary.", "Mary baked the cake."),
+    ("compound_sentence", "I went to the store, and I bought coffee.", "I went to the store."),
+    ("incorrect_noun_usage", "She enjoys to run.", "She enjoys running."),
+    ("double_negative", "She doesn't need no help.", "She doesn't need any help."),
+    ("double_negative", "She doesn't need no help.", "Neither John nor Mary came."),
+    ("double_negative", "She doesn't need no help.", "No, I don't like it."),
+    ("misplaced_modifier", "She almost drove her kids to school.", "She drove her kids to school."),
+    ("comma_splice", "She went to the store, she bought some coffee.", "She went to the store, and she bought some coffee."),
+]
+
+
+def fired(sentence):
+    *_, findings = get_rule_engine().run(get_nlp()(sentence))
+    return {finding.rule for finding in findings}
+
+@pytest.mark.parametrize("rule, positive, negative", CASES)
+def test_rule_fires_on_positive_example(rule, positive, negative):
+    assert rule in fired(positive)
+
+@pytest.mark.parametrize("rule, positive, negative", CASES)
+def test_rule_ignores_negative_example(rule, positive, negative):
+    assert rule not in fired(negative)
+
+def test_all_findings_are_reported():
+    rules = fired("The cake was not baked by Mary.")
+    assert {"negative_sentence", "passive_voice"} <= rules
+
+def test_fingerprint_follows_predicate_code():
+    changed = [Rule(rule.name, token=lambda token: token.dep_ == "nsubj") if rule.name == "negative_sentence" else rule for rule in RULES]
+    assert rules_fingerprint() == rules_fingerprint(list(RULES))
+    assert rules_fingerprint(changed) != rules_fingerprint()
@@ -0,0 +1,25 @@
+""" Incremental re-checking: a second batch run over the same input reuses every stored analysis. """
+import pytest
+
+spacy = pytest.importorskip("spacy")
+if not spacy.util.is_package("en_core_web_sm"):
+    pytest.skip("en_core_web_sm is not installed", allow_module_level=True)
+
+import batch  # noqa: E402
+
+SENTENCES = ["John threw the ball.", "The cake was baked by Mary.", "She does not like coffee."]
+
+
+def run_batch(tmp_path, capsys):
+    source = tmp_path / "input.txt"
+    source.write_text("\n".join(SENTENCES) + "\n", encoding="utf-8")
+    output = tmp_path / "output.jsonl"
+    assert batch.main([str(source), "-o", str(output), "--store", str(tmp_path / "store.sqlite3")]) == 0
+    return output.read_text(encoding="utf-8"), capsys.readouterr().err
+
+def test_second_run_reuses_stored_analyses(tmp_path, capsys):
+    first_output, first_report = run_batch(tmp_path, capsys)
+    second_output, second_report = run_batch(tmp_path, capsys)
+    assert "Store: 0 reused, 3 parsed" in first_report
+    assert "Store: 3 reused, 0 parsed" in second_report
+    assert second_output == first_output